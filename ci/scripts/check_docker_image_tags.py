@@ -2,6 +2,11 @@
 import sys
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 EXIT_CODE = 0
 
 services = ["geth", "polkadot", "bitcoin"]
@@ -9,8 +14,8 @@ with (
     open("./localnet/docker-compose.yml", 'r', encoding="utf-8") as docker_compose_file,
     open(".github/workflows/_40_post_check.yml", 'r', encoding="utf-8") as github_actions_file
 ):
-    docker_compose = yaml.safe_load(docker_compose_file)
-    github_actions = yaml.safe_load(github_actions_file)
+    docker_compose = yaml.load(docker_compose_file, Loader=SafeLoader)
+    github_actions = yaml.load(github_actions_file, Loader=SafeLoader)
     for service in services:
         docker_image = docker_compose["services"][service]["image"]
         github_image = github_actions["jobs"]["bouncer"]["services"][service]["image"]
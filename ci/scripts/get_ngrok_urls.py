@@ -7,13 +7,22 @@ import os
 # Get the path to the GitHub output file from the environment variables
 github_output_path = os.getenv('GITHUB_OUTPUT')
 
-chainflip_node_tunnel_logs = open('/tmp/ngrok-chainflip-node.log', encoding='utf-8').read()
-polkadot_tunnel_logs = open('/tmp/ngrok-polkadot.log', encoding='utf-8').read()
 
-chainflip_node_tunnel_url = [line for line in chainflip_node_tunnel_logs.split(
-    '\n') if 'started tunnel' in line][-1].split('url=')[-1].strip().split('https://')[-1]
-polkadot_node_tunnel_url = [line for line in polkadot_tunnel_logs.split(
-    '\n') if 'started tunnel' in line][-1].split('url=')[-1].strip().split('https://')[-1]
+def last_tunnel_url(log_path):
+    """Return the host of the last `started tunnel` url in an ngrok log"""
+    with open(log_path, 'rb') as log_file:
+        logs = log_file.read()
+    index = logs.rfind(b'started tunnel')
+    if index == -1:
+        raise ValueError(f"No started tunnel found in {log_path}")
+    line_start = logs.rfind(b'\n', 0, index) + 1
+    line_end = logs.find(b'\n', index)
+    line = logs[line_start:line_end if line_end != -1 else len(logs)]
+    return line.rsplit(b'url=', 1)[-1].strip().rsplit(b'https://', 1)[-1].decode('utf-8')
+
+
+chainflip_node_tunnel_url = last_tunnel_url('/tmp/ngrok-chainflip-node.log')
+polkadot_node_tunnel_url = last_tunnel_url('/tmp/ngrok-polkadot.log')
 
 polkadot_js_chainflip_node = f"https://polkadot.js.org/apps/?rpc=wss%3A%2F%2F{chainflip_node_tunnel_url}#/explorer"
 polkadot_js_polkadot_node = f"https://polkadot.js.org/apps/?rpc=wss%3A%2F%2F{polkadot_node_tunnel_url}#/explorer"